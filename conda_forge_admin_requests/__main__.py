@@ -5,11 +5,35 @@ import sys
 import subprocess
 from conda_forge_admin_requests import get_actions, register_actions
 
-def _get_task_files():
-    return (
-        list(glob.glob(os.path.join("requests", "*.yml")))
-        + list(glob.glob(os.path.join("requests", "*.yaml")))
-    )
+# use the libyaml (C) bindings when PyYAML was built with them, otherwise
+# fall back to the pure-Python implementation
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _load_request(filename):
+    # hand libyaml the raw bytes so it does the UTF-8 decoding itself
+    with open(filename, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _list_request_dir():
+    # same as glob("requests/*"), in one directory scan
+    with os.scandir("requests") as it:
+        return sorted(
+            (entry for entry in it if not entry.name.startswith(".")),
+            key=lambda entry: entry.name,
+        )
+
+
+def _get_task_files(entries=None):
+    if entries is None:
+        entries = _list_request_dir()
+    return [
+        entry.path
+        for entry in entries
+        if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+    ]
 
 
 def check():
@@ -21,9 +45,10 @@ def check():
             "Please put YAML-formatted requests in the `requests` directory."
         )
 
+    entries = _list_request_dir()
     if not all(
-        fname.endswith(".yaml") or fname.endswith(".yml")
-        for fname in glob.glob("requests/*")
+        entry.name.endswith((".yaml", ".yml"))
+        for entry in entries
     ):
         assert False, (
             "Found non-YAML files in the `requests` directory. Please "
@@ -31,16 +56,15 @@ def check():
             "`.yml` or `.yaml`."
         )
 
-    filenames = _get_task_files()
+    filenames = _get_task_files(entries)
+    actions = get_actions()
 
     for filename in filenames:
-        with open(filename) as f:
-            request = yaml.safe_load(f)
+        request = _load_request(filename)
 
         assert "action" in request, f"Invalid request: {request}"
 
         action = request["action"]
-        actions = get_actions()
 
         if action not in actions:
             assert False, f"Unknown action: {action}"
@@ -50,15 +74,16 @@ def check():
 
 def run():
     filenames = _get_task_files()
+    actions = get_actions()
 
+    processed = []
+    messages = []
     for filename in filenames:
-        with open(filename) as f:
-            request = yaml.safe_load(f)
+        request = _load_request(filename)
 
         assert "action" in request, f"Invalid request: {request}"
 
         action = request["action"]
-        actions = get_actions()
 
         if action not in actions:
             assert False, f"Unknown action: {action}"
@@ -66,23 +91,29 @@ def run():
         try_again = getattr(actions[action], "run")(request)
 
         if try_again:
-            with open(filename, "w") as fp:
-                yaml.dump(try_again, fp)
-            subprocess.check_call(["git", "add", filename])
-            subprocess.check_call(
-                [
-                    "git",
-                    "commit",
-                    "--allow-empty",
-                    "-m",
-                    f"Keeping {filename} after failed {action}",
-                ]
-            )
+            with open(filename, "wb") as fp:
+                yaml.dump(try_again, fp, Dumper=_YAML_DUMPER, encoding="utf-8")
+            messages.append(f"Keeping {filename} after failed {action}")
         else:
-            subprocess.check_call(["git", "rm", filename])
-            subprocess.check_call(
-                ["git", "commit", "-m", f"Remove {filename} after {action}"]
-            )
+            os.remove(filename)
+            messages.append(f"Remove {filename} after {action}")
+        processed.append(filename)
+
+    if not processed:
+        return
+
+    # record all processed requests in one commit; committing the paths
+    # directly stages them in the same git process
+    if len(messages) == 1:
+        commit_msg = ["-m", messages[0]]
+    else:
+        commit_msg = [
+            "-m", f"Process {len(processed)} requests",
+            "-m", "\n".join(messages),
+        ]
+    subprocess.check_call(
+        ["git", "commit", "--allow-empty", *commit_msg, "--", *processed]
+    )
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@ import os
 import requests
 import subprocess
 
+from .utils import find_missing_feedstocks
+
 
 def raise_json_for_status(request):
     try:
@@ -74,12 +76,7 @@ def run(request):
 def check(request):
     assert "feedstocks" in request
 
-    missing_feedstocks = []
-
-    for feedstock in request["feedstocks"]:
-        r = requests.get(f"https://github.com/conda-forge/{feedstock}-feedstock")
-        if r.status_code != 200:
-            missing_feedstocks.append(feedstock)
+    missing_feedstocks = find_missing_feedstocks(request["feedstocks"])
 
     if missing_feedstocks:
         raise RuntimeError(
@@ -1,12 +1,16 @@
 import io
 import json
 import os
-import requests
 
 import ruamel.yaml
 from conda_forge_metadata.feedstock_outputs import sharded_path as _get_sharded_path
 import github
 
+from .utils import find_missing_feedstocks
+
+# use round-trip to preserve comments
+_YAML = ruamel.yaml.YAML(typ="rt")
+
 
 def _test_and_raise_besides_file_not_exists(e: github.GithubException):
     if isinstance(e, github.UnknownObjectException):
@@ -52,30 +56,49 @@ def _add_feedstock_output(
             print(f"    output {pkg_name} already exists for feedstock conda-forge/{feedstock}-feedstock", flush=True)
 
 
-def _add_feedstock_output_glob(
-    feedstock,
-    glob_str,
+def _add_feedstock_output_globs(
+    feedstock_globs,
 ):
+    """Add all (feedstock, glob) pairs to the autoreg allowlist in one commit."""
     gh_token = os.environ['GITHUB_TOKEN']
     gh = github.Github(auth=github.Auth.Token(gh_token))
     repo = gh.get_repo("conda-forge/feedstock-outputs")
     contents = repo.get_contents("feedstock_outputs_autoreg_allowlist.yml")
 
-    yaml = ruamel.yaml.YAML(typ="rt")  # use round-trip to preserve comments
-    data = yaml.load(contents.decoded_content.decode("utf-8"))
-    current_globs = data.get(feedstock, [])
-    if glob_str not in current_globs:
-        current_globs.append(glob_str)
-    data[feedstock] = current_globs
+    data = _YAML.load(contents.decoded_content.decode("utf-8"))
+    added = []
+    # sets of the globs per feedstock, for O(1) duplicate checks
+    existing = {}
+    for feedstock, glob_str in feedstock_globs:
+        current_globs = data.get(feedstock, [])
+        if feedstock not in existing:
+            existing[feedstock] = set(current_globs)
+        if glob_str not in existing[feedstock]:
+            existing[feedstock].add(glob_str)
+            current_globs.append(glob_str)
+            added.append((feedstock, glob_str))
+        else:
+            print(f"    glob {glob_str} already exists for feedstock conda-forge/{feedstock}-feedstock", flush=True)
+        data[feedstock] = current_globs
+
+    if not added:
+        return
+
     fp = io.StringIO()
-    yaml.dump(data, fp)
+    _YAML.dump(data, fp)
+    if len(added) == 1:
+        feedstock, glob_str = added[0]
+        msg = f"add glob {glob_str} for conda-forge/{feedstock}-feedstock"
+    else:
+        msg = f"add {len(added)} globs for {len({f for f, _ in added})} feedstocks"
     repo.update_file(
         contents.path,
-        f"[cf admin skip] ***NO_CI*** add glob {glob_str} for conda-forge/{feedstock}-feedstock",
+        f"[cf admin skip] ***NO_CI*** {msg}",
         fp.getvalue(),
         contents.sha,
     )
-    print(f"    glob {glob_str} added for feedstock conda-forge/{feedstock}-feedstock", flush=True)
+    for feedstock, glob_str in added:
+        print(f"    glob {glob_str} added for feedstock conda-forge/{feedstock}-feedstock", flush=True)
 
 
 def check(request):
@@ -83,6 +106,7 @@ def check(request):
     assert action == "add_feedstock_output"
 
     assert request.get("feedstock_to_output_mapping")
+    feedstocks = set()
     for req in request["feedstock_to_output_mapping"]:
         for feedstock, pkg_name in req.items():
             if not isinstance(pkg_name, str):
@@ -90,13 +114,14 @@ def check(request):
                     f"Value for '{feedstock}' entry must be a str (output name, or a glob), "
                     f"but you provided {pkg_name:!r}."
                 )
-            if feedstock.endswith("-feedstock"):
-                feedstock = feedstock[:-10]
+            feedstock = feedstock.removesuffix("-feedstock")
+            feedstocks.add(feedstock)
 
-            r = requests.head(
-                f"https://github.com/conda-forge/{feedstock}-feedstock"
-            )
-            r.raise_for_status()
+    missing_feedstocks = find_missing_feedstocks(sorted(feedstocks))
+    if missing_feedstocks:
+        raise RuntimeError(
+            f"feedstocks {missing_feedstocks} could not be found!"
+        )
 
 
 def run(request):
@@ -105,19 +130,28 @@ def run(request):
 
     assert request.get("feedstock_to_output_mapping")
     items_to_keep = []
+    feedstock_globs = []
     for req in request["feedstock_to_output_mapping"]:
         for feedstock, pkg_name in req.items():
             try:
-                if feedstock.endswith("-feedstock"):
-                    feedstock = feedstock[:-10]
+                feedstock = feedstock.removesuffix("-feedstock")
                 if any(_c in pkg_name for _c in ["*", "?", "[", "]", "!"]):
-                    _add_feedstock_output_glob(feedstock, pkg_name)
+                    # globs all live in one file, so update it once at the end
+                    feedstock_globs.append((feedstock, pkg_name))
                 else:
                     _add_feedstock_output(feedstock, pkg_name)
             except Exception as e:
                 print(f"    could not add output {pkg_name} for feedstock conda-forge/{feedstock}-feedstock: {e}", flush=True)
                 items_to_keep.append({feedstock: pkg_name})
 
+    if feedstock_globs:
+        try:
+            _add_feedstock_output_globs(feedstock_globs)
+        except Exception as e:
+            for feedstock, glob_str in feedstock_globs:
+                print(f"    could not add glob {glob_str} for feedstock conda-forge/{feedstock}-feedstock: {e}", flush=True)
+                items_to_keep.append({feedstock: glob_str})
+
     if items_to_keep:
         request["feedstock_to_output_mapping"] = items_to_keep
         return request
@@ -5,7 +5,7 @@ import subprocess
 import tempfile
 import github
 
-from .utils import write_secrets_to_files
+from .utils import find_missing_feedstocks, write_secrets_to_files
 
 
 FEEDSTOCK_TOKENS_REPO = None
@@ -103,7 +103,7 @@ def reset_feedstock_token(
 
         subprocess.check_call(
             [
-                'conda', 'smithy', 'generate-feedstock-token',
+                'conda-smithy', 'generate-feedstock-token',
                 '--feedstock_directory', feedstock_dir
             ]
             + owner_info
@@ -111,7 +111,7 @@ def reset_feedstock_token(
         )
         subprocess.check_call(
             [
-                'conda', 'smithy', 'register-feedstock-token',
+                'conda-smithy', 'register-feedstock-token',
                 '--without-circle', '--without-drone',
             ]
             + [
@@ -132,7 +132,7 @@ def reset_feedstock_token(
 
         subprocess.check_call(
             [
-                'conda', 'smithy', 'rotate-binstar-token',
+                'conda-smithy', 'rotate-binstar-token',
                 '--without-appveyor', '--without-azure',
                 '--without-circle', '--without-drone',
                 '--without-github-actions',
@@ -193,14 +193,7 @@ def run(request):
 def check(request):
     assert "feedstocks" in request
     feedstocks = request["feedstocks"]
-    missing_feedstocks = []
-
-    for feedstock in feedstocks:
-        r = requests.get(
-            f"https://github.com/conda-forge/{feedstock}-feedstock"
-        )
-        if r.status_code != 200:
-            missing_feedstocks.append(feedstock)
+    missing_feedstocks = find_missing_feedstocks(feedstocks)
 
     if missing_feedstocks:
         raise RuntimeError(
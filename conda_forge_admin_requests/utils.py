@@ -1,9 +1,17 @@
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
+from requests.adapters import HTTPAdapter
 from conda_build.utils import create_file_with_permissions
 
 SMITHY_CONF = os.path.expanduser('~/.conda-smithy')
 
+# shared keep-alive session so repeated checks reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=4))
+
 
 def _write_token(name, token):
     path = os.path.join(SMITHY_CONF, name + '.token')
@@ -44,3 +52,30 @@ def parse_filename(filename: str) -> tuple[str, str, str, str]:
         raise ValueError(f"Unknown extension for {filename}")
     pkg_name, version, build = basename.rsplit("-", 2)
     return pkg_name, version, build, extension
+
+
+# the same feedstock is often named by several requests in one check run;
+# only definite answers are cached, errors propagate and are retried
+@functools.lru_cache(maxsize=1024)
+def _feedstock_exists(feedstock: str) -> bool:
+    r = _SESSION.head(
+        f"https://github.com/conda-forge/{feedstock}-feedstock",
+        allow_redirects=True,
+        timeout=10,
+    )
+    if r.status_code == 404:
+        return False
+    # anything else besides success (e.g. 429 or 5xx) says nothing about
+    # whether the feedstock exists
+    r.raise_for_status()
+    return True
+
+
+def find_missing_feedstocks(feedstocks: list[str], max_workers: int = 4) -> list[str]:
+    """Return the feedstocks (sans `-feedstock`) that do not exist on GitHub."""
+    # keep the pool small, these are unauthenticated requests to github.com
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        exists = list(executor.map(_feedstock_exists, feedstocks))
+    return [
+        feedstock for feedstock, found in zip(feedstocks, exists) if not found
+    ]